@@ -238,7 +238,7 @@ class Player(object):
         # Override in special cases only if absolutely necessary
         cls = self.__class__
         new_player = cls(**self.init_kwargs)
-        new_player.match_attributes = copy.copy(self.match_attributes)
+        new_player.set_match_attributes(**self.match_attributes)
         return new_player
 
     def reset(self):
@@ -6,7 +6,6 @@ import random
 
 from axelrod.action import Action
 from axelrod.player import Player
-from axelrod.random_ import random_choice
 
 C, D = Action.C, Action.D
 
@@ -37,22 +36,31 @@ class Champion(Player):
         'manipulates_state': False
     }
 
+    def receive_match_attributes(self):
+        # The length may be infinite when the number of turns is not known in
+        # advance, in which case the thresholds are too.
+        # The first move is always a cooperation, even if the length is
+        # unknown.
+        expected_length = self.match_attributes['length']
+        self.cooperate_until = max(1, expected_length / 20)
+        self.mirror_until = expected_length * 5 / 40
+
     def strategy(self, opponent: Player) -> Action:
         current_round = len(self.history)
-        expected_length = self.match_attributes['length']
         # Cooperate for the first 1/20-th of the game
-        if current_round == 0:
-            return C
-        if current_round < expected_length / 20:
+        if current_round < self.cooperate_until:
             return C
         # Mirror partner for the next phase
-        if current_round < expected_length * 5 / 40:
+        if current_round < self.mirror_until:
             return opponent.history[-1]
         # Now cooperate unless all of the necessary conditions are true
-        defection_prop = opponent.defections / len(opponent.history)
         if opponent.history[-1] == D:
             r = random.random()
-            if defection_prop >= max(0.4, r):
+            defections = opponent.defections
+            turns = len(opponent.history)
+            # The opponent has defected at least 40% of the time and more
+            # often than r
+            if 5 * defections >= 2 * turns and defections / turns >= r:
                 return D
         return C
 
@@ -92,8 +100,13 @@ class Eatherley(Player):
             return C
         # Respond to defections with probability equal to opponent's total
         # proportion of defections
-        defection_prop = opponent.defections / len(opponent.history)
-        return random_choice(1 - defection_prop)
+        defections = opponent.defections
+        turns = len(opponent.history)
+        if defections == turns:
+            return D
+        if random.random() * turns < turns - defections:
+            return C
+        return D
 
 
 class Tester(Player):
@@ -133,7 +146,7 @@ class Tester(Player):
             return D
         # Am I TFT?
         if self.is_TFT:
-            return D if opponent.history[-1:] == [D] else C
+            return opponent.history[-1]
         else:
             # Did opponent defect?
             if opponent.history[-1] == D:
@@ -192,8 +205,7 @@ class Gladstein(Player):
                 self.patsy = False
                 return C
             # Cooperate as long as the cooperation ratio is below 0.5
-            cooperation_ratio = self.cooperations / len(self.history)
-            if cooperation_ratio > 0.5:
+            if 2 * self.cooperations > len(self.history):
                 return D
             return C
         else:
@@ -46,6 +46,55 @@ class TestChampion(TestPlayer):
         self.versus_test(axelrod.Alternator(), expected_actions=actions_3,
                          match_attributes={"length": 200}, seed=2)
 
+        # Without a known length: cooperate once, then respond to defections
+        actions = [(C, D)] + [(D, D)] * 4
+        self.versus_test(axelrod.Defector(), expected_actions=actions,
+                         match_attributes={"length": -1}, turns=5)
+        self.versus_test(axelrod.Defector(), expected_actions=actions,
+                         match_attributes={"length": 0}, turns=5)
+
+    def test_phase_boundaries(self):
+        player = self.player()
+        player.set_match_attributes(length=200)
+        self.assertEqual(player.cooperate_until, 10)
+        self.assertEqual(player.mirror_until, 25)
+
+        player.set_match_attributes(length=210)
+        self.assertEqual(player.cooperate_until, 10.5)
+        self.assertEqual(player.mirror_until, 26.25)
+
+        # Cooperates on the first move when the length is unknown
+        player.set_match_attributes(length=-1)
+        self.assertEqual(player.cooperate_until, 1)
+        self.assertEqual(player.mirror_until, -0.125)
+
+        player.set_match_attributes(length=0)
+        self.assertEqual(player.cooperate_until, 1)
+        self.assertEqual(player.mirror_until, 0)
+
+        # Infinite expected length (e.g. matches with prob_end)
+        player.set_match_attributes(length=float('inf'))
+        self.assertEqual(player.cooperate_until, float('inf'))
+        self.assertEqual(player.mirror_until, float('inf'))
+
+        player.set_match_attributes(length=210)
+        # Cloned players receive the same boundaries
+        clone = player.clone()
+        self.assertEqual(clone.cooperate_until, 10.5)
+        self.assertEqual(clone.mirror_until, 26.25)
+
+    def test_infinite_length(self):
+        # Always cooperates when the expected length is infinite
+        actions = [(C, D)] * 20
+        self.versus_test(axelrod.Defector(), expected_actions=actions,
+                         match_attributes={"length": float('inf')}, turns=20)
+
+        match = axelrod.Match((self.player(), axelrod.Defector()),
+                              prob_end=0.1)
+        self.assertEqual(match.players[0].cooperate_until, float('inf'))
+        for action, _ in match.play():
+            self.assertEqual(action, C)
+
 
 class TestEatherley(TestPlayer):
 